@@ -1,6 +1,7 @@
 """Configuration loading and parsing for LiteLLM-style YAML configs."""
 
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 import yaml
@@ -8,7 +9,7 @@ import yaml
 from providers.base import ModelConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersonalityConfig:
     """Configuration for a debate personality.
 
@@ -23,7 +24,7 @@ class PersonalityConfig:
     model_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DebateSettings:
     """Settings for the debate process.
 
@@ -32,15 +33,17 @@ class DebateSettings:
         max_rounds: Maximum number of debate rounds
         consensus_prompt: Name of the consensus check personality
         synthesizer_prompt: Name of the synthesizer personality
+        max_concurrency: Maximum number of personalities streaming at once
     """
 
     output_dir: Path
     max_rounds: int
     consensus_prompt: str
     synthesizer_prompt: str
+    max_concurrency: int = 4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Complete configuration for the Prizms debate system.
 
@@ -70,6 +73,10 @@ class Config:
     def synthesizer_prompt(self) -> str:
         return self.debate_settings.synthesizer_prompt
 
+    @property
+    def max_concurrency(self) -> int:
+        return self.debate_settings.max_concurrency
+
 
 def _parse_model_list(
     model_list: list[dict], config_dir: Path
@@ -156,6 +163,7 @@ def load_config(config_path: Path) -> Config:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If config file is invalid YAML
         KeyError: If required config keys are missing
+        ValueError: If a setting or model entry is invalid
     """
     with open(config_path) as f:
         data = yaml.safe_load(f)
@@ -168,11 +176,23 @@ def load_config(config_path: Path) -> Config:
     if not Path(output_dir).is_absolute():
         output_dir = config_dir / output_dir
 
+    # A semaphore of 0 would block every stream forever, so require at least 1
+    max_concurrency = settings_data.get("max_concurrency", 4)
+    if (
+        isinstance(max_concurrency, bool)
+        or not isinstance(max_concurrency, int)
+        or max_concurrency < 1
+    ):
+        raise ValueError(
+            f"debate_settings.max_concurrency must be an integer >= 1, got {max_concurrency!r}"
+        )
+
     debate_settings = DebateSettings(
         output_dir=Path(output_dir),
         max_rounds=settings_data.get("max_rounds", 3),
         consensus_prompt=settings_data.get("consensus_prompt", "consensus_check"),
         synthesizer_prompt=settings_data.get("synthesizer_prompt", "synthesizer"),
+        max_concurrency=max_concurrency,
     )
 
     # Parse model_list
@@ -190,9 +210,13 @@ def load_config(config_path: Path) -> Config:
     )
 
 
+@cache
 def load_prompt(prompt_path: Path) -> str:
     """Load a personality prompt from a file.
 
+    Prompts are read once per path and cached, since every debate round
+    asks for the same prompts again.
+
     Args:
         prompt_path: Path to the prompt file
 
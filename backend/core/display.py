@@ -1,40 +1,90 @@
 """Rich terminal UI components for streaming display."""
 
+from __future__ import annotations
+
 import re
+from collections import deque
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.layout import Layout
+
+# Number of trailing lines shown in each personality panel
+PANEL_MAX_LINES = 30
+
+THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
 
-from rich.console import Console
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.text import Text
 
-console = Console()
+@cache
+def get_console() -> Console:
+    """Return the shared Rich console, creating it on first use.
 
+    Rich is imported here rather than at module level so importing this
+    module doesn't pull in the whole rich package.
+    """
+    from rich.console import Console
+
+    return Console()
 
+
+@cache
 def format_personality_name(name: str) -> str:
     """Format personality name for display.
 
     Converts underscores to spaces and title-cases the result.
     Example: "chaos_monkey" -> "Chaos Monkey"
+
+    Cached, since the same few names are formatted every round.
     """
     return name.replace("_", " ").title()
 
 
+def _personality_column(personality: str) -> Layout:
+    """Create a layout column holding the personality's panel.
+
+    The Panel and its Text are built once here; update_panel only swaps
+    the text content, so streaming never rebuilds renderables or titles.
+    """
+    from rich.layout import Layout
+    from rich.panel import Panel
+    from rich.text import Text
+
+    panel = Panel(
+        Text("", overflow="fold"),
+        title=format_personality_name(personality),
+        border_style="blue",
+    )
+    return Layout(panel, name=personality, ratio=1)
+
+
 def create_layout(personalities: list[str]) -> Layout:
     """Create dynamic N-column layout for personalities.
 
     Creates a horizontal split with one column per personality,
     each with equal ratio.
     """
+    from rich.layout import Layout
+
     layout = Layout()
-    layout.split_row(*[Layout(name=p, ratio=1) for p in personalities])
+    layout.split_row(*[_personality_column(p) for p in personalities])
     return layout
 
 
+@cache
+def _shared_layout(personalities: tuple[str, ...]) -> Layout:
+    """Build the layout for a set of personalities once and reuse it."""
+    return create_layout(list(personalities))
+
+
 def create_round_layout(personalities: list[str], round_num: int) -> Layout:
     """Create dynamic N-column layout for personalities with round context.
 
     Creates a horizontal split with one column per personality,
     each with equal ratio. The round number is stored for use in panel titles.
+    The layout is built on the first round and reused by later rounds with
+    the same personalities; callers reset the panel text each round.
 
     Args:
         personalities: List of personality names
@@ -43,8 +93,7 @@ def create_round_layout(personalities: list[str], round_num: int) -> Layout:
     Returns:
         Layout configured for the round
     """
-    layout = Layout()
-    layout.split_row(*[Layout(name=p, ratio=1) for p in personalities])
+    layout = _shared_layout(tuple(personalities))
     # Store round number as layout attribute for panel updates
     layout._round_num = round_num  # type: ignore[attr-defined]
     return layout
@@ -53,21 +102,51 @@ def create_round_layout(personalities: list[str], round_num: int) -> Layout:
 def update_panel(layout: Layout, personality: str, content: str) -> None:
     """Update a personality's panel with new content.
 
-    Truncates content to the last 30 lines to keep the display manageable.
+    Truncates content to the last PANEL_MAX_LINES lines to keep the display
+    manageable. The panel must come from create_layout/create_round_layout.
     """
     lines = content.split("\n")
-    max_lines = 30
-    if len(lines) > max_lines:
-        display_content = "...\n" + "\n".join(lines[-max_lines:])
+    if len(lines) > PANEL_MAX_LINES:
+        display_content = "...\n" + "\n".join(lines[-PANEL_MAX_LINES:])
     else:
         display_content = content
 
-    panel = Panel(
-        Text(display_content, overflow="fold"),
-        title=format_personality_name(personality),
-        border_style="blue",
-    )
-    layout[personality].update(panel)
+    panel = layout[personality].renderable
+    panel.renderable.plain = display_content
+
+
+class StreamTail:
+    """Rolling view of the last lines of a streaming response.
+
+    Completed lines go into a bounded deque and the unfinished last line is
+    kept separately, so text() costs the same however long the response
+    grows. Its output matches what update_panel shows for the full content.
+    """
+
+    def __init__(self, max_lines: int = PANEL_MAX_LINES) -> None:
+        self.max_lines = max_lines
+        # The partial line always occupies one of the visible lines
+        self._lines: deque[str] = deque(maxlen=max_lines - 1)
+        self._partial: list[str] = []
+        self._completed = 0
+
+    def append(self, chunk: str) -> None:
+        """Add a streamed chunk."""
+        *completed, rest = chunk.split("\n")
+        if completed:
+            completed[0] = "".join(self._partial) + completed[0]
+            self._lines.extend(completed)
+            self._completed += len(completed)
+            self._partial = [rest]
+        else:
+            self._partial.append(rest)
+
+    def text(self) -> str:
+        """Return the visible tail, prefixed with "..." when truncated."""
+        tail = "\n".join([*self._lines, "".join(self._partial)])
+        if self._completed >= self.max_lines:
+            return "...\n" + tail
+        return tail
 
 
 def extract_answer(content: str) -> str:
@@ -79,8 +158,9 @@ def extract_answer(content: str) -> str:
     Returns:
         The answer portion, or the full content if no think tags found
     """
-    think_pattern = r"<think>.*?</think>"
-    answer = re.sub(think_pattern, "", content, flags=re.DOTALL).strip()
+    if "<think>" not in content:
+        return content.strip()
+    answer = THINK_RE.sub("", content).strip()
     return answer if answer else content.strip()
 
 
@@ -100,7 +180,7 @@ def print_round_summary(round_num: int, responses: dict[str, str]) -> None:
         parts.append(f"{display_name} ({char_count:,} chars)")
 
     summary = " | ".join(parts)
-    console.print(f"[dim]Round {round_num} complete: {summary}[/dim]")
+    get_console().print(f"[dim]Round {round_num} complete: {summary}[/dim]")
 
 
 def print_answers(round_num: int, responses: dict[str, str]) -> None:
@@ -112,6 +192,7 @@ def print_answers(round_num: int, responses: dict[str, str]) -> None:
         round_num: The round number
         responses: Dict mapping personality names to their full responses
     """
+    console = get_console()
     console.print(f"\n[bold]Round {round_num} Answers[/bold]")
     console.print("─" * 60)
 
@@ -1,13 +1,16 @@
 """LangGraph state and graph definition for multi-round debate."""
 
 import operator
-from typing import Annotated, Any, TypedDict
+from functools import cache
+from typing import Annotated, TypedDict
 
+from langchain_core.language_models import BaseChatModel
 from langgraph.graph import END, StateGraph
 
-from providers.base import LLMProvider, ModelConfig
+from providers.base import LLMProvider
 
-from .config import Config, PersonalityConfig
+from .config import Config
+from .nodes import check_consensus, debate_round, synthesize
 
 
 class DebateState(TypedDict):
@@ -21,6 +24,7 @@ class DebateState(TypedDict):
     personalities: list[str]  # List of personality names participating in debate
     config: Config  # Full configuration object
     providers: dict[str, LLMProvider]  # Provider instances by type
+    llms: dict[tuple[str, int | None], BaseChatModel]  # LLM clients reused across rounds
     max_rounds: int  # Safety limit
     current_round: int  # Counter
     rounds: Annotated[list[dict[str, str]], operator.add]  # Append-only history
@@ -43,15 +47,16 @@ def should_continue(state: DebateState) -> str:
     return "debate_round"
 
 
+@cache
 def build_graph() -> StateGraph:
     """Build and return the compiled debate graph.
 
+    The graph is static, so it is compiled once and cached.
+
     Graph structure:
         debate_round -> check_consensus -> [synthesize | debate_round]
         synthesize -> END
     """
-    from .nodes import check_consensus, debate_round, synthesize
-
     graph = StateGraph(DebateState)
 
     # Add nodes
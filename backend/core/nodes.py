@@ -1,24 +1,35 @@
 """Node functions for the debate graph."""
 
+from __future__ import annotations
+
 import asyncio
 import json
-import re
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
-from rich.layout import Layout
-from rich.live import Live
 
-from providers.base import LLMProvider, ModelConfig
+from providers.base import LLMProvider
 
-from .config import Config, PersonalityConfig, load_prompt
+from .config import Config, load_prompt
 from .display import (
-    console,
+    StreamTail,
     create_round_layout,
+    format_personality_name,
+    get_console,
     print_answers,
     print_round_summary,
     update_panel,
 )
 
+if TYPE_CHECKING:
+    from rich.layout import Layout
+
+# Seconds between display updates while streaming (matches Live's 10 Hz refresh)
+PANEL_UPDATE_INTERVAL = 0.1
+
 
 def format_previous_round(previous_round: dict[str, str] | None) -> str:
     """Format the previous round's responses for inclusion in the prompt.
@@ -35,7 +46,7 @@ def format_previous_round(previous_round: dict[str, str] | None) -> str:
 
     lines = ["\n\n## Previous Round Responses\n"]
     for personality, response in previous_round.items():
-        display_name = personality.replace("_", " ").title()
+        display_name = format_personality_name(personality)
         # Truncate very long responses to keep context manageable
         truncated = response[:2000] + "..." if len(response) > 2000 else response
         lines.append(f"**{display_name}**: {truncated}\n")
@@ -43,11 +54,54 @@ def format_previous_round(previous_round: dict[str, str] | None) -> str:
     return "".join(lines)
 
 
+@cache
+def get_system_message(prompt_path: Path) -> SystemMessage:
+    """Get the system message for a personality prompt.
+
+    Built once per prompt file, since every round sends the same prompt.
+    """
+    return SystemMessage(content=load_prompt(prompt_path))
+
+
+def get_llm_for_model(
+    model_name: str,
+    config: Config,
+    providers: dict[str, LLMProvider],
+    instance: int | None = None,
+    llms: dict[tuple[str, int | None], BaseChatModel] | None = None,
+):
+    """Get the LLM client for a configured model.
+
+    Args:
+        model_name: A model_name from the config's model_list
+        config: Full configuration object
+        providers: Dictionary of provider instances by type
+        instance: Optional instance number for providers that require
+                 separate instances for parallel execution (e.g., LM Studio).
+        llms: Optional cache of clients keyed by (model_name, instance),
+              so the same client is reused across rounds.
+
+    Returns:
+        Configured LangChain chat model for this model
+    """
+    key = (model_name, instance)
+    if llms is not None and key in llms:
+        return llms[key]
+
+    model_config = config.models[model_name]
+    provider = providers[model_config.provider_type]
+    llm = provider.get_llm(model_config, instance)
+    if llms is not None:
+        llms[key] = llm
+    return llm
+
+
 def get_llm_for_personality(
     personality_name: str,
     config: Config,
     providers: dict[str, LLMProvider],
     instance: int | None = None,
+    llms: dict[tuple[str, int | None], BaseChatModel] | None = None,
 ):
     """Get the LLM client for a specific personality.
 
@@ -57,67 +111,131 @@ def get_llm_for_personality(
         providers: Dictionary of provider instances by type
         instance: Optional instance number for providers that require
                  separate instances for parallel execution (e.g., LM Studio).
+        llms: Optional cache of clients keyed by (model_name, instance),
+              so the same client is reused across rounds.
 
     Returns:
         Configured ChatOpenAI client for this personality
     """
     personality_config = config.personalities[personality_name]
-    model_config = config.models[personality_config.model_name]
-    provider = providers[model_config.provider_type]
-    return provider.get_llm(model_config, instance)
+    return get_llm_for_model(
+        personality_config.model_name, config, providers, instance, llms
+    )
+
+
+def get_fallback_llm(
+    config: Config,
+    providers: dict[str, LLMProvider],
+    llms: dict[tuple[str, int | None], BaseChatModel] | None = None,
+):
+    """Get the LLM client for the first configured model.
+
+    Used by check_consensus and synthesize when their personality or
+    prompt isn't configured.
+    """
+    first_model_name = next(iter(config.models))
+    return get_llm_for_model(first_model_name, config, providers, llms=llms)
 
 
 async def stream_personality(
     personality_name: str,
-    question: str,
-    previous_round: dict[str, str] | None,
+    user_message: HumanMessage,
     config: Config,
     providers: dict[str, LLMProvider],
-    buffers: dict[str, str],
     layout: Layout,
-    live: Live,
     instance: int | None = None,
-) -> tuple[str, str]:
+    llms: dict[tuple[str, int | None], BaseChatModel] | None = None,
+) -> str:
     """Stream LLM response for a personality and update the display.
 
     Args:
         personality_name: Name of the personality
-        question: The original question
-        previous_round: Previous round responses (None for first round)
+        user_message: The round's user message (question plus previous round),
+                      shared by all personalities
         config: Full configuration object
         providers: Dictionary of provider instances by type
-        buffers: Shared dict for accumulating streamed content
-        layout: Rich Layout for display
-        live: Rich Live context for refreshing
+        layout: Rich Layout for display (redrawn by the caller's Live)
         instance: Optional instance number for providers that require
                  separate instances for parallel execution (e.g., LM Studio).
+        llms: Optional per-run cache of LLM clients
 
     Returns:
-        Tuple of (personality_name, full_response)
+        The full response
     """
     # Get the LLM for this personality
-    llm = get_llm_for_personality(personality_name, config, providers, instance)
+    llm = get_llm_for_personality(personality_name, config, providers, instance, llms)
 
     # Load the prompt for this personality
     personality_config = config.personalities[personality_name]
-    system_prompt = load_prompt(personality_config.prompt_path)
+    messages = [get_system_message(personality_config.prompt_path), user_message]
 
-    # Build user message with optional previous round context
-    user_content = question + format_previous_round(previous_round)
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(content=user_content),
-    ]
+    # Collect chunks in a list; repeated str += copies the whole response per chunk
+    parts: list[str] = []
+    # Only the last lines are visible, so render from a bounded tail
+    tail = StreamTail()
 
-    buffers[personality_name] = ""
+    # Live redraws on its own timer, so only re-render the panel at that rate
+    loop = asyncio.get_running_loop()
+    last_update = 0.0
 
     async for chunk in llm.astream(messages):
-        if chunk.content:
-            buffers[personality_name] += chunk.content
-            update_panel(layout, personality_name, buffers[personality_name])
-            live.refresh()
+        content = chunk.content
+        # Skip empty chunks (role headers, usage-only and keepalive chunks)
+        if not content:
+            continue
+        parts.append(content)
+        tail.append(content)
+        # Whitespace-only chunks are buffered until the next visible one
+        if content.isspace():
+            continue
+        now = loop.time()
+        if now - last_update >= PANEL_UPDATE_INTERVAL:
+            update_panel(layout, personality_name, tail.text())
+            last_update = now
+
+    update_panel(layout, personality_name, tail.text())
+
+    return "".join(parts)
 
-    return (personality_name, buffers[personality_name])
+
+def find_json_object(text: str) -> str | None:
+    """Find the first balanced {...} span in text.
+
+    Walks the text once from the first "{", tracking brace depth and
+    skipping braces inside JSON string literals, so nested objects and
+    reasoning before the JSON are handled.
+
+    Args:
+        text: LLM response that may contain a JSON object
+
+    Returns:
+        The first balanced object span, or None if there isn't one
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
 
 
 def _compute_provider_instances(
@@ -154,11 +272,11 @@ def _compute_provider_instances(
     return instance_map
 
 
-def debate_round(state: dict) -> dict:
+async def debate_round(state: dict) -> dict:
     """Execute one round of debate with all personalities responding in parallel.
 
-    This node runs all personalities concurrently, streaming their responses
-    to a multi-column Rich display.
+    This node runs all personalities concurrently (up to max_concurrency at a
+    time), streaming their responses to a multi-column Rich display.
 
     Args:
         state: Current debate state
@@ -170,6 +288,7 @@ def debate_round(state: dict) -> dict:
     question = state["question"]
     config: Config = state["config"]
     providers: dict[str, LLMProvider] = state["providers"]
+    llms = state.get("llms")
     current_round = state.get("current_round", 0)
 
     # Get previous round if exists
@@ -177,38 +296,44 @@ def debate_round(state: dict) -> dict:
     previous_round = rounds[-1] if rounds else None
 
     round_num = current_round + 1
+    console = get_console()
     console.print(f"\n[bold cyan]Round {round_num}[/bold cyan]")
 
     layout = create_round_layout(personalities, round_num)
-    buffers: dict[str, str] = {}
 
     # Compute per-provider instance numbers for LM Studio parallel execution
     instance_map = _compute_provider_instances(personalities, config)
 
-    # Initialize panels
+    # Reset panels (the layout is reused across rounds)
     for personality in personalities:
         update_panel(layout, personality, "Waiting for response...")
 
-    async def run_all():
-        with Live(layout, console=console, refresh_per_second=10) as live:
-            tasks = [
-                stream_personality(
-                    p,
-                    question,
-                    previous_round,
-                    config,
-                    providers,
-                    buffers,
-                    layout,
-                    live,
-                    instance=instance_map[p],  # Per-provider instance number
-                )
-                for p in personalities
-            ]
-            results = await asyncio.gather(*tasks)
-        return dict(results)
-
-    responses = asyncio.run(run_all())
+    # Every personality gets the same user message this round
+    user_message = HumanMessage(content=question + format_previous_round(previous_round))
+
+    semaphore = asyncio.Semaphore(config.max_concurrency)
+
+    async def run_one(personality: str) -> str:
+        # Bound how many personalities stream at once (one backend may serve them all)
+        async with semaphore:
+            return await stream_personality(
+                personality,
+                user_message,
+                config,
+                providers,
+                layout,
+                instance=instance_map[personality],  # Per-provider instance number
+                llms=llms,
+            )
+
+    # Only debate rounds use Live, so import it here like the rest of rich
+    from rich.live import Live
+
+    with Live(layout, console=console, refresh_per_second=10):
+        async with asyncio.TaskGroup() as tg:
+            tasks = {p: tg.create_task(run_one(p)) for p in personalities}
+    # Keep personality order regardless of which stream finished first
+    responses = {p: task.result() for p, task in tasks.items()}
 
     # After streaming completes, print compact summary and answers
     print_round_summary(round_num, responses)
@@ -220,7 +345,7 @@ def debate_round(state: dict) -> dict:
     }
 
 
-def check_consensus(state: dict) -> dict:
+async def check_consensus(state: dict) -> dict:
     """Check if personalities have reached consensus.
 
     Uses a neutral LLM call to analyze the latest round of responses
@@ -232,6 +357,7 @@ def check_consensus(state: dict) -> dict:
     Returns:
         Updated state with consensus_reached and consensus_reasoning
     """
+    console = get_console()
     rounds = state.get("rounds", [])
     if not rounds:
         return {"consensus_reached": False, "consensus_reasoning": "No responses yet"}
@@ -244,8 +370,24 @@ def check_consensus(state: dict) -> dict:
         console.print("[dim]Skipping consensus check on first round...[/dim]")
         return {"consensus_reached": False, "consensus_reasoning": "First round - continuing debate"}
 
+    # Identical responses (or a lone personality) agree without asking an LLM.
+    # Empty responses usually mean a backend failed, so they never count.
+    responses = list(current_round.values())
+    if not any(response.strip() for response in responses):
+        shortcut_reasoning = None
+    elif len(responses) == 1:
+        shortcut_reasoning = "Only one personality is debating"
+    elif len(set(responses)) == 1:
+        shortcut_reasoning = "All responses are identical"
+    else:
+        shortcut_reasoning = None
+    if shortcut_reasoning:
+        console.print(f"[green]Consensus reached:[/green] {shortcut_reasoning}")
+        return {"consensus_reached": True, "consensus_reasoning": shortcut_reasoning}
+
     config: Config = state["config"]
     providers: dict[str, LLMProvider] = state["providers"]
+    llms = state.get("llms")
 
     # Get the consensus check personality config
     consensus_prompt_name = config.consensus_prompt
@@ -253,7 +395,9 @@ def check_consensus(state: dict) -> dict:
     try:
         personality_config = config.personalities[consensus_prompt_name]
         consensus_prompt_text = load_prompt(personality_config.prompt_path)
-        llm = get_llm_for_personality(consensus_prompt_name, config, providers)
+        llm = get_llm_for_personality(
+            consensus_prompt_name, config, providers, llms=llms
+        )
     except (KeyError, FileNotFoundError):
         # Fallback if personality/prompt doesn't exist
         consensus_prompt_text = """You are analyzing a multi-perspective debate. Review the responses below 
@@ -262,13 +406,11 @@ the core points, even if they differ in emphasis or framing.
 
 Respond with JSON only: {"consensus": true/false, "reasoning": "brief explanation"}"""
         # Use the first available model as fallback
-        first_model = next(iter(config.models.values()))
-        provider = providers[first_model.provider_type]
-        llm = provider.get_llm(first_model)
+        llm = get_fallback_llm(config, providers, llms)
 
     # Format responses for analysis
     response_text = "\n\n".join(
-        f"**{p.replace('_', ' ').title()}**: {r}"
+        f"**{format_personality_name(p)}**: {r}"
         for p, r in current_round.items()
     )
 
@@ -279,16 +421,16 @@ Respond with JSON only: {"consensus": true/false, "reasoning": "brief explanatio
 
     console.print("[dim]Checking for consensus...[/dim]")
 
-    # Synchronous call for consensus check (no need to stream)
-    response = asyncio.run(llm.ainvoke(messages))
+    # Single call for consensus check (no need to stream)
+    response = await llm.ainvoke(messages)
     content = response.content
 
     # Parse JSON response
     try:
         # Try to extract JSON from the response
-        json_match = re.search(r'\{[^}]+\}', content)
-        if json_match:
-            result = json.loads(json_match.group())
+        json_text = find_json_object(content)
+        if json_text:
+            result = json.loads(json_text)
             consensus = result.get("consensus", False)
             reasoning = result.get("reasoning", "No reasoning provided")
         else:
@@ -309,7 +451,7 @@ Respond with JSON only: {"consensus": true/false, "reasoning": "brief explanatio
     }
 
 
-def synthesize(state: dict) -> dict:
+async def synthesize(state: dict) -> dict:
     """Produce final synthesized output from the dedicated synthesizer prompt.
 
     The synthesizer reviews all rounds of debate and produces a final
@@ -323,25 +465,27 @@ def synthesize(state: dict) -> dict:
     """
     config: Config = state["config"]
     providers: dict[str, LLMProvider] = state["providers"]
+    llms = state.get("llms")
     question = state["question"]
     rounds = state.get("rounds", [])
     consensus_reasoning = state.get("consensus_reasoning", "")
 
     synthesizer_prompt_name = config.synthesizer_prompt
-    display_name = synthesizer_prompt_name.replace("_", " ").title()
+    display_name = format_personality_name(synthesizer_prompt_name)
+    console = get_console()
     console.print(f"\n[bold magenta]Synthesis by {display_name}[/bold magenta]")
 
     # Get synthesizer personality and LLM
     try:
         personality_config = config.personalities[synthesizer_prompt_name]
         base_prompt = load_prompt(personality_config.prompt_path)
-        llm = get_llm_for_personality(synthesizer_prompt_name, config, providers)
+        llm = get_llm_for_personality(
+            synthesizer_prompt_name, config, providers, llms=llms
+        )
     except (KeyError, FileNotFoundError):
         base_prompt = "You are a rational, dispassionate synthesizer of multiple perspectives."
         # Use the first available model as fallback
-        first_model = next(iter(config.models.values()))
-        provider = providers[first_model.provider_type]
-        llm = provider.get_llm(first_model)
+        llm = get_fallback_llm(config, providers, llms)
 
     # Build context from all rounds
     context_parts = [f"Original Question: {question}\n"]
@@ -349,7 +493,7 @@ def synthesize(state: dict) -> dict:
     for i, round_responses in enumerate(rounds, 1):
         context_parts.append(f"\n## Round {i} Responses\n")
         for personality, response in round_responses.items():
-            personality_display = personality.replace("_", " ").title()
+            personality_display = format_personality_name(personality)
             # Truncate for context window
             truncated = response[:1500] + "..." if len(response) > 1500 else response
             context_parts.append(f"**{personality_display}**: {truncated}\n")
@@ -365,17 +509,24 @@ def synthesize(state: dict) -> dict:
         HumanMessage(content="".join(context_parts)),
     ]
 
-    # Stream the synthesis
-    full_response = ""
-
-    async def stream_synthesis():
-        nonlocal full_response
-        async for chunk in llm.astream(messages):
-            if chunk.content:
-                full_response += chunk.content
-                console.print(chunk.content, end="")
-
-    asyncio.run(stream_synthesis())
-    console.print()  # Newline after streaming
+    # Stream the synthesis as plain text straight to the console's file;
+    # console.print per chunk is costly and would parse brackets as markup
+    out = console.file
+    parts: list[str] = []
+    loop = asyncio.get_running_loop()
+    last_flush = 0.0
+    async for chunk in llm.astream(messages):
+        content = chunk.content
+        if not content:
+            continue
+        parts.append(content)
+        out.write(content)
+        now = loop.time()
+        if now - last_flush >= PANEL_UPDATE_INTERVAL:
+            out.flush()
+            last_flush = now
+    out.write("\n")  # Newline after streaming
+    out.flush()
+    full_response = "".join(parts)
 
     return {"final_synthesis": full_response}
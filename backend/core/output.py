@@ -1,60 +1,79 @@
 """Response parsing and file output."""
 
-import re
+import asyncio
 from pathlib import Path
 
-from rich.console import Console
+from .display import format_personality_name, get_console
 
-from .display import format_personality_name
 
-console = Console()
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+NO_COT_PLACEHOLDER = "*No chain of thought captured.*"
 
 
 def split_cot_and_answer(content: str) -> tuple[str, str]:
     """Split response into chain-of-thought and answer.
 
-    Extracts content within <think>...</think> tags as chain-of-thought,
-    and everything else as the answer.
+    Extracts content within the first <think>...</think> block as
+    chain-of-thought, and everything outside any think block as the answer.
+    Scans with str.find in a single pass rather than regex search + sub.
 
     Returns:
         A tuple of (chain_of_thought, answer).
     """
-    think_pattern = r"<think>(.*?)</think>"
-    match = re.search(think_pattern, content, re.DOTALL)
+    start = content.find(THINK_OPEN)
+    end = content.find(THINK_CLOSE, start + len(THINK_OPEN)) if start >= 0 else -1
+    if end < 0:
+        return "", content.strip()
 
-    if match:
-        cot = match.group(1).strip()
-        answer = re.sub(think_pattern, "", content, flags=re.DOTALL).strip()
-    else:
-        cot = ""
-        answer = content.strip()
+    cot = content[start + len(THINK_OPEN):end].strip()
 
-    return cot, answer
+    # Keep the text between think blocks, dropping every complete block
+    answer_parts = [content[:start]]
+    pos = end + len(THINK_CLOSE)
+    while (start := content.find(THINK_OPEN, pos)) >= 0:
+        end = content.find(THINK_CLOSE, start + len(THINK_OPEN))
+        if end < 0:
+            break
+        answer_parts.append(content[pos:start])
+        pos = end + len(THINK_CLOSE)
+    answer_parts.append(content[pos:])
 
+    return cot, "".join(answer_parts).strip()
 
-def save_responses(responses: dict[str, str], output_dir: Path) -> None:
+
+async def save_responses(responses: dict[str, str], output_dir: Path) -> None:
     """Save each personality response to COT and answer files.
 
     Creates separate files for chain-of-thought (*.cot.md) and
-    final answers (*.ans.md) for each personality.
+    final answers (*.ans.md) for each personality. All files are
+    written concurrently in worker threads.
     """
+    console = get_console()
     output_dir.mkdir(exist_ok=True)
 
+    payloads: list[tuple[Path, str]] = []
     for personality, content in responses.items():
         cot, answer = split_cot_and_answer(content)
         display_name = format_personality_name(personality)
 
-        # Save chain of thought
-        cot_path = output_dir / f"{personality}.cot.md"
-        if cot:
-            cot_content = f"# {display_name} - Chain of Thought\n\n{cot}"
-        else:
-            cot_content = f"# {display_name} - Chain of Thought\n\n*No chain of thought captured.*"
-        cot_path.write_text(cot_content)
-        console.print(f"[green]Saved:[/green] {cot_path}")
-
-        # Save answer
-        ans_path = output_dir / f"{personality}.ans.md"
-        ans_content = f"# {display_name} - Answer\n\n{answer}"
-        ans_path.write_text(ans_content)
-        console.print(f"[green]Saved:[/green] {ans_path}")
+        # Build each file body in one formatting step straight into the payloads
+        payloads.append((
+            output_dir / f"{personality}.cot.md",
+            f"# {display_name} - Chain of Thought\n\n{cot or NO_COT_PLACEHOLDER}",
+        ))
+        payloads.append((
+            output_dir / f"{personality}.ans.md",
+            f"# {display_name} - Answer\n\n{answer}",
+        ))
+
+    # Encode up front and write bytes, skipping the text-mode file wrapper
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(path.write_bytes, text.encode("utf-8"))
+            for path, text in payloads
+        )
+    )
+
+    for path, _ in payloads:
+        console.print(f"[green]Saved:[/green] {path}")
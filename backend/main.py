@@ -10,18 +10,25 @@ the final integrated perspective.
 Supports multiple LLM providers: Ollama, vLLM, and LM Studio.
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from core.config import Config, get_debate_personalities, load_config
-from core.display import console
-from core.graph import build_graph
+from core.display import get_console
 from core.output import save_responses
-from providers.factory import get_providers
+
+# Config, the graph and the providers pull in LangChain/LangGraph, so they are
+# imported where they're used; --help and argument errors return quickly.
+if TYPE_CHECKING:
+    from core.config import Config
 
 
-def run_debate(
+async def run_debate(
     question: str,
     config: Config,
     personalities: list[str],
@@ -38,6 +45,9 @@ def run_debate(
     Returns:
         Final state from the graph execution
     """
+    from core.graph import build_graph
+    from providers.factory import get_providers
+
     # Build and compile the graph
     graph = build_graph()
 
@@ -50,6 +60,7 @@ def run_debate(
         "personalities": personalities,
         "config": config,
         "providers": providers,
+        "llms": {},
         "max_rounds": max_rounds,
         "current_round": 0,
         "rounds": [],
@@ -58,8 +69,8 @@ def run_debate(
         "final_synthesis": None,
     }
 
-    # Run the graph
-    final_state = graph.invoke(initial_state)
+    # Run the graph; all nodes share this one event loop
+    final_state = await graph.ainvoke(initial_state)
 
     return final_state
 
@@ -68,6 +79,7 @@ def main(
     question: str,
     config: Config,
     max_rounds_override: int | None = None,
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None,
 ) -> None:
     """Main entry point.
 
@@ -75,7 +87,13 @@ def main(
         question: The question to debate
         config: Configuration object
         max_rounds_override: CLI override for max rounds
+        loop_factory: Optional event loop factory (e.g. uvloop.new_event_loop);
+                      defaults to the standard asyncio loop
     """
+    from core.config import get_debate_personalities
+
+    console = get_console()
+
     # Get debate personalities (excludes system personalities like consensus_check, synthesizer)
     personalities = get_debate_personalities(config)
 
@@ -89,28 +107,32 @@ def main(
     # Determine max rounds
     max_rounds = max_rounds_override if max_rounds_override else config.max_rounds
 
-    console.print(f"[bold]Question:[/bold] {question}")
-    console.print(f"[dim]Personalities: {', '.join(personalities)}[/dim]")
-    console.print(f"[dim]Synthesizer: {config.synthesizer_prompt}[/dim]")
-    console.print(f"[dim]Max rounds: {max_rounds}[/dim]\n")
+    console.print(
+        f"[bold]Question:[/bold] {question}\n"
+        f"[dim]Personalities: {', '.join(personalities)}[/dim]\n"
+        f"[dim]Synthesizer: {config.synthesizer_prompt}[/dim]\n"
+        f"[dim]Max rounds: {max_rounds}[/dim]\n"
+    )
 
-    # Run the debate
-    final_state = run_debate(question, config, personalities, max_rounds)
+    # One event loop for the whole run: the debate graph, then saving outputs
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        # Run the debate
+        final_state = runner.run(run_debate(question, config, personalities, max_rounds))
 
-    # Collect all responses from all rounds for saving
-    all_responses: dict[str, str] = {}
-    rounds = final_state.get("rounds", [])
+        # Collect all responses from all rounds for saving
+        all_responses: dict[str, str] = {}
+        rounds = final_state.get("rounds", [])
 
-    # Use the last round's responses as the primary output
-    if rounds:
-        all_responses = rounds[-1].copy()
+        # Use the last round's responses as the primary output
+        if rounds:
+            all_responses = rounds[-1].copy()
 
-    # Add synthesis as a special entry (will be handled separately for COT/answer split)
-    if final_state.get("final_synthesis"):
-        all_responses["synthesizer"] = final_state["final_synthesis"]
+        # Add synthesis as a special entry (will be handled separately for COT/answer split)
+        if final_state.get("final_synthesis"):
+            all_responses["synthesizer"] = final_state["final_synthesis"]
 
-    console.print()  # Add spacing
-    save_responses(all_responses, config.output_dir)
+        console.print()  # Add spacing
+        runner.run(save_responses(all_responses, config.output_dir))
 
     # Summary
     console.print(f"\n[dim]Completed in {len(rounds)} round(s)[/dim]")
@@ -148,6 +170,7 @@ if __name__ == "__main__":
         help="Maximum number of debate rounds (default: 3 or config value)",
     )
     args = parser.parse_args()
+    console = get_console()
 
     # Resolve question from file or argument
     if args.file:
@@ -168,5 +191,16 @@ if __name__ == "__main__":
         console.print(f"[red]Error:[/red] Config file not found: {args.config}")
         sys.exit(1)
 
+    from core.config import load_config
+
     config = load_config(args.config)
-    main(question, config, args.max_rounds)
+
+    # Use uvloop's faster event loop when it's installed (optional "uvloop" extra)
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    main(question, config, args.max_rounds, loop_factory=loop_factory)
@@ -8,7 +8,7 @@ The only providers NOT handled here are:
 - Gemini: Uses ChatGoogleGenerativeAI (different client)
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from langchain_openai import ChatOpenAI
 
@@ -0,0 +1,34 @@
+"""Tests for configuration loading in core.config."""
+
+import pytest
+
+from core.config import load_config
+
+
+def write_config(tmp_path, settings: str):
+    """Write a minimal config with the given debate_settings body."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"debate_settings:\n{settings}")
+    return config_path
+
+
+class TestMaxConcurrency:
+    """Test validation of debate_settings.max_concurrency."""
+
+    def test_default(self, tmp_path):
+        """Should default to 4 when not set."""
+        config = load_config(write_config(tmp_path, "  max_rounds: 3\n"))
+        assert config.max_concurrency == 4
+
+    def test_valid_value(self, tmp_path):
+        """Should accept a positive integer."""
+        config = load_config(write_config(tmp_path, "  max_concurrency: 1\n"))
+        assert config.max_concurrency == 1
+
+    @pytest.mark.parametrize("value", ["0", "-2", "2.5", "two", "true"])
+    def test_invalid_value(self, tmp_path, value):
+        """Should reject anything but an integer >= 1, naming the field."""
+        config_path = write_config(tmp_path, f"  max_concurrency: {value}\n")
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            load_config(config_path)
@@ -0,0 +1,65 @@
+"""Tests for streaming display helpers in core.display."""
+
+import pytest
+
+from core.display import StreamTail, extract_answer
+
+
+def full_content_tail(content: str, max_lines: int) -> str:
+    """Reference truncation: what update_panel shows for the full content."""
+    lines = content.split("\n")
+    if len(lines) > max_lines:
+        return "...\n" + "\n".join(lines[-max_lines:])
+    return content
+
+
+class TestStreamTail:
+    """Test the rolling tail used while streaming."""
+
+    def test_empty(self):
+        """A tail with no chunks should render as empty text."""
+        assert StreamTail().text() == ""
+
+    def test_partial_lines_are_joined(self):
+        """Chunks without newlines should build up the current line."""
+        tail = StreamTail()
+        for chunk in ["Hel", "lo", " world"]:
+            tail.append(chunk)
+        assert tail.text() == "Hello world"
+
+    @pytest.mark.parametrize("max_lines", [1, 3, 30])
+    @pytest.mark.parametrize(
+        "chunks",
+        [
+            ["line\n"] * 40,
+            ["a", "b\nc", "\n\n", "d\ne\nf", "g"] * 12,
+            ["\n"] * 5,
+            ["one line only"],
+        ],
+    )
+    def test_matches_full_content_truncation(self, chunks, max_lines):
+        """Rendering after every chunk should match truncating the whole text."""
+        tail = StreamTail(max_lines)
+        content = ""
+        for chunk in chunks:
+            tail.append(chunk)
+            content += chunk
+            assert tail.text() == full_content_tail(content, max_lines)
+
+
+class TestExtractAnswer:
+    """Test extracting the answer shown after each round."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ("  Just an answer.\n", "Just an answer."),
+            ("<think>Reasoning</think>\n\nAnswer", "Answer"),
+            ("<think>a</think>Part one <think>b</think>part two", "Part one part two"),
+            ("<think>Only reasoning</think>", "<think>Only reasoning</think>"),
+            ("<think>Unclosed reasoning", "<think>Unclosed reasoning"),
+        ],
+    )
+    def test_extract_answer(self, content, expected):
+        """Should drop think blocks, falling back to the full content."""
+        assert extract_answer(content) == expected
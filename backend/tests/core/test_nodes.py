@@ -0,0 +1,171 @@
+"""Tests for helpers and nodes in core.nodes."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from core.config import Config, DebateSettings, PersonalityConfig
+from core.nodes import check_consensus, debate_round, find_json_object
+from providers.base import ModelConfig
+
+
+def make_config(tmp_path, personalities, max_concurrency=4):
+    """Build a Config whose personalities all use a single "fake" model."""
+    prompt_path = tmp_path / "prompt.txt"
+    prompt_path.write_text("You are a debater.")
+    return Config(
+        debate_settings=DebateSettings(
+            output_dir=tmp_path,
+            max_rounds=1,
+            consensus_prompt="consensus_check",
+            synthesizer_prompt="synthesizer",
+            max_concurrency=max_concurrency,
+        ),
+        models={
+            "fake": ModelConfig(
+                model_name="fake",
+                provider_type="fake",
+                model_id="fake",
+                api_base="",
+                api_key="",
+            )
+        },
+        personalities={
+            name: PersonalityConfig(name, prompt_path, "fake")
+            for name in personalities
+        },
+    )
+
+
+class TestFindJsonObject:
+    """Test locating the consensus JSON in an LLM response."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ('{"consensus": true, "reasoning": "Agreed"}', {"consensus": True, "reasoning": "Agreed"}),
+            (
+                'After review:\n{"consensus": false, "reasoning": "Split"} Done.',
+                {"consensus": False, "reasoning": "Split"},
+            ),
+            (
+                '{"consensus": true, "details": {"agree": ["a", "b"]}}',
+                {"consensus": True, "details": {"agree": ["a", "b"]}},
+            ),
+            (
+                '{"consensus": false, "reasoning": "They disagree on {scope} and \\"}\\""}',
+                {"consensus": False, "reasoning": 'They disagree on {scope} and "}"'},
+            ),
+        ],
+    )
+    def test_finds_first_object(self, content, expected):
+        """Should return the first balanced object, including nested braces."""
+        assert json.loads(find_json_object(content)) == expected
+
+    @pytest.mark.parametrize(
+        "content",
+        ["No JSON here.", '{"consensus": true', ""],
+    )
+    def test_no_object(self, content):
+        """Should return None when there is no complete object."""
+        assert find_json_object(content) is None
+
+
+class TestCheckConsensusShortcut:
+    """Test that trivial consensus skips the LLM call."""
+
+    @pytest.mark.parametrize(
+        "responses",
+        [
+            {"critic": "Same answer.", "judge": "Same answer."},
+            {"critic": "Only one voice."},
+        ],
+    )
+    async def test_trivial_consensus(self, responses):
+        """Identical or single responses should reach consensus without config or providers."""
+        state = {"rounds": [responses, responses], "current_round": 2}
+
+        result = await check_consensus(state)
+
+        assert result["consensus_reached"] is True
+
+    @pytest.mark.parametrize(
+        "responses",
+        [
+            {"critic": "", "judge": ""},
+            {"critic": "  \n", "judge": "  \n"},
+            {"critic": ""},
+            {"critic": "  \n"},
+        ],
+    )
+    async def test_identical_empty_responses_ask_the_llm(self, tmp_path, responses):
+        """Empty responses, even from a lone personality, should not count as consensus."""
+        calls = []
+
+        async def ainvoke(messages):
+            calls.append(messages)
+            return SimpleNamespace(content='{"consensus": false, "reasoning": "No answers"}')
+
+        llm = SimpleNamespace(ainvoke=ainvoke)
+        provider = SimpleNamespace(get_llm=lambda config, instance=None: llm)
+        state = {
+            "rounds": [responses, responses],
+            "current_round": 2,
+            "config": make_config(tmp_path, list(responses)),
+            "providers": {"fake": provider},
+            "llms": {},
+        }
+
+        result = await check_consensus(state)
+
+        assert len(calls) == 1
+        assert result["consensus_reached"] is False
+
+
+class ConcurrencyTracker:
+    """Fake LLM provider that records how many streams are open at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    def get_llm(self, config, instance=None):
+        return SimpleNamespace(astream=self.astream)
+
+    async def astream(self, messages):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            for word in ("Thinking", " about", " it."):
+                await asyncio.sleep(0.01)
+                yield SimpleNamespace(content=word)
+        finally:
+            self.active -= 1
+
+
+class TestDebateRoundConcurrency:
+    """Test that debate_round bounds concurrent personality streams."""
+
+    @pytest.mark.parametrize("max_concurrency", [1, 2, 5])
+    async def test_streams_bounded_by_max_concurrency(self, tmp_path, max_concurrency):
+        """No more than max_concurrency streams should be open at once."""
+        personalities = [f"debater_{i}" for i in range(5)]
+        config = make_config(tmp_path, personalities, max_concurrency)
+        tracker = ConcurrencyTracker()
+        state = {
+            "question": "Is this bounded?",
+            "personalities": personalities,
+            "config": config,
+            "providers": {"fake": tracker},
+            "llms": {},
+            "current_round": 0,
+            "rounds": [],
+        }
+
+        result = await debate_round(state)
+
+        assert tracker.peak == min(max_concurrency, len(personalities))
+        assert list(result["rounds"][0]) == personalities
+        assert set(result["rounds"][0].values()) == {"Thinking about it."}
@@ -0,0 +1,43 @@
+"""Tests for response parsing in core.output."""
+
+import pytest
+
+from core.output import split_cot_and_answer
+
+
+class TestSplitCotAndAnswer:
+    """Test splitting responses into chain-of-thought and answer."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ("Just an answer.", ("", "Just an answer.")),
+            ("<think>Reasoning</think>Answer", ("Reasoning", "Answer")),
+            ("  <think>\n  Reasoning \n</think>\n\nAnswer  \n", ("Reasoning", "Answer")),
+            ("Intro <think>Reasoning</think> outro", ("Reasoning", "Intro  outro")),
+            ("<think></think>Answer", ("", "Answer")),
+        ],
+    )
+    def test_single_block(self, content, expected):
+        """Should split on a single think block and strip whitespace."""
+        assert split_cot_and_answer(content) == expected
+
+    def test_unclosed_think_tag_is_answer(self):
+        """An unclosed <think> tag should leave the whole response as answer."""
+        content = "<think>Still thinking when the stream ended"
+        assert split_cot_and_answer(content) == ("", content)
+
+    def test_multiple_blocks(self):
+        """COT comes from the first block; all blocks are removed from the answer."""
+        content = "<think>First</think>A<think>Second</think>B"
+        assert split_cot_and_answer(content) == ("First", "AB")
+
+    def test_trailing_unclosed_block_kept_in_answer(self):
+        """A later unclosed <think> tag should stay in the answer text."""
+        content = "<think>First</think>Answer <think>dangling"
+        assert split_cot_and_answer(content) == ("First", "Answer <think>dangling")
+
+    def test_nested_open_tag_stops_at_first_close(self):
+        """The block ends at the first </think> after the opening tag."""
+        content = "<think>a<think>b</think>rest</think>end"
+        assert split_cot_and_answer(content) == ("a<think>b", "rest</think>end")
@@ -0,0 +1,32 @@
+"""Shared fixtures for provider tests."""
+
+import pytest
+
+from providers.base import ModelConfig
+from providers.factory import get_providers
+
+
+@pytest.fixture(scope="session")
+def make_config():
+    """Factory for ModelConfig instances with test defaults.
+
+    Only provider_type and model_id vary between most tests; the model name
+    mirrors the model ID and the API key defaults to a placeholder.
+    """
+
+    def _make(provider_type, model_id, api_key="test-key", api_base=""):
+        return ModelConfig(
+            model_name=model_id,
+            provider_type=provider_type,
+            model_id=model_id,
+            api_base=api_base,
+            api_key=api_key,
+        )
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def providers_registry():
+    """Provider registry from the factory, built once per session."""
+    return get_providers()
@@ -0,0 +1,231 @@
+"""Tests for the providers with native LangChain clients.
+
+This module tests the providers that don't go through ChatOpenAI:
+- Anthropic: ChatAnthropic (langchain-anthropic)
+- Gemini: ChatGoogleGenerativeAI (langchain-google-genai)
+
+Both share the same contract (API key required, instance ignored), so the
+unit tests are parameterized over a single provider table.
+"""
+
+import os
+from typing import NamedTuple
+
+import pytest
+from unittest.mock import MagicMock
+
+from langchain_core.messages import HumanMessage
+
+from providers.anthropic import AnthropicProvider
+from providers.gemini import GeminiProvider
+
+
+# Environment variables for integration tests
+ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
+GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY", "")
+
+
+class NativeProvider(NamedTuple):
+    """A provider backed by a native LangChain client."""
+
+    provider_type: str
+    provider_cls: type
+    client_target: str  # Client class patched in unit tests
+    env_var: str  # Environment variable named in the missing-key error
+    api_key_kwarg: str  # Keyword the client receives the API key as
+
+
+NATIVE_PROVIDERS = [
+    NativeProvider(
+        "anthropic",
+        AnthropicProvider,
+        "providers.anthropic.ChatAnthropic",
+        "ANTHROPIC_API_KEY",
+        "api_key",
+    ),
+    NativeProvider(
+        "gemini",
+        GeminiProvider,
+        "providers.gemini.ChatGoogleGenerativeAI",
+        "GOOGLE_API_KEY",
+        "google_api_key",
+    ),
+]
+
+# Model IDs exercised per provider
+MODELS = {
+    "anthropic": [
+        "claude-sonnet-4-20250514",
+        "claude-opus-4-20250514",
+        "claude-3-5-haiku-20241022",
+    ],
+    "gemini": [
+        "gemini-2.0-flash",
+        "gemini-2.0-flash-lite",
+        "gemini-1.5-pro",
+    ],
+}
+
+# One case per (provider, model ID) pair
+MODEL_CASES = [
+    pytest.param(native, model_id, id=model_id)
+    for native in NATIVE_PROVIDERS
+    for model_id in MODELS[native.provider_type]
+]
+
+
+# =============================================================================
+# Unit Tests - Parameterized across native-client providers
+# =============================================================================
+
+
+@pytest.fixture(params=NATIVE_PROVIDERS, ids=lambda native: native.provider_type)
+def native(request):
+    """The native-client provider under test."""
+    return request.param
+
+
+@pytest.fixture
+def mock_client(monkeypatch, native):
+    """Replace the provider's LangChain client class with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(native.client_target, mock)
+    return mock
+
+
+class TestNativeProvider:
+    """Test suite shared by AnthropicProvider and GeminiProvider."""
+
+    def test_provider_instantiation(self, native):
+        """Provider should instantiate without errors."""
+        provider = native.provider_cls()
+        assert provider is not None
+
+    # Note: a whitespace-only API key is truthy, so it passes validation and
+    # only fails on the first API call. Providers don't strip keys today.
+    def test_api_key_required(self, native, make_config):
+        """Should raise ValueError if no API key provided."""
+        provider = native.provider_cls()
+        config = make_config(
+            native.provider_type, MODELS[native.provider_type][0], api_key=""
+        )
+
+        with pytest.raises(ValueError, match="API key is required"):
+            provider.get_llm(config)
+
+    def test_api_key_error_mentions_env_var(self, native, make_config):
+        """Error message should mention the provider's environment variable."""
+        provider = native.provider_cls()
+        config = make_config(
+            native.provider_type, MODELS[native.provider_type][0], api_key=""
+        )
+
+        with pytest.raises(ValueError, match=native.env_var):
+            provider.get_llm(config)
+
+    def test_get_llm_returns_client(self, native, make_config, mock_client):
+        """Should return the native client instance when configured properly."""
+        model_id = MODELS[native.provider_type][0]
+        provider = native.provider_cls()
+        config = make_config(native.provider_type, model_id)
+
+        result = provider.get_llm(config)
+
+        assert result is mock_client.return_value
+        mock_client.assert_called_once_with(
+            model=model_id,
+            **{native.api_key_kwarg: "test-key"},
+        )
+
+    def test_get_llm_ignores_instance_parameter(self, native, make_config, mock_client):
+        """Instance parameter should be ignored (the API handles concurrency)."""
+        provider = native.provider_cls()
+        config = make_config(native.provider_type, MODELS[native.provider_type][0])
+
+        # All instance values should work the same way
+        for instance in (None, 0, 5):
+            assert provider.get_llm(config, instance=instance) is mock_client.return_value
+
+    def test_provider_in_factory(self, native, providers_registry):
+        """Provider should be available via get_providers."""
+        assert native.provider_type in providers_registry
+        assert isinstance(providers_registry[native.provider_type], native.provider_cls)
+
+
+class TestNativeProviderModels:
+    """Test that different model IDs are passed correctly."""
+
+    @pytest.mark.parametrize("native,model_id", MODEL_CASES)
+    def test_different_models(self, native, model_id, make_config, mock_client):
+        """Should correctly pass different model IDs."""
+        provider = native.provider_cls()
+        config = make_config(native.provider_type, model_id)
+
+        provider.get_llm(config)
+
+        # Verify the model was passed correctly
+        assert mock_client.call_args.kwargs["model"] == model_id
+
+
+# =============================================================================
+# Integration Tests - Per-provider, skipped if API key not set
+# =============================================================================
+
+
+# (provider_type, provider class, model ID, API key)
+INTEGRATION_CASES = [
+    pytest.param(
+        "anthropic",
+        AnthropicProvider,
+        "claude-3-5-haiku-20241022",  # Fastest/cheapest model
+        ANTHROPIC_API_KEY,
+        id="anthropic",
+        marks=pytest.mark.skipif(
+            not ANTHROPIC_API_KEY,
+            reason="ANTHROPIC_API_KEY environment variable not set",
+        ),
+    ),
+    pytest.param(
+        "gemini",
+        GeminiProvider,
+        "gemini-2.0-flash",  # Fast and efficient model
+        GOOGLE_API_KEY,
+        id="gemini",
+        marks=pytest.mark.skipif(
+            not GOOGLE_API_KEY,
+            reason="GOOGLE_API_KEY environment variable not set",
+        ),
+    ),
+]
+
+
+@pytest.mark.integration
+class TestNativeIntegration:
+    """Integration tests requiring real API keys.
+
+    Each case is skipped unless its API key is set. To run them:
+        ANTHROPIC_API_KEY=sk-ant-... GOOGLE_API_KEY=AI... uv run pytest tests/providers/test_native_providers.py --run-integration -v -k "Integration"
+    """
+
+    @pytest.mark.parametrize(
+        "provider_type,provider_cls,model_id,api_key", INTEGRATION_CASES
+    )
+    async def test_streaming_response(
+        self, provider_type, provider_cls, model_id, api_key, make_config
+    ):
+        """Verify streaming chunks arrive from the API."""
+        provider = provider_cls()
+        config = make_config(provider_type, model_id, api_key=api_key)
+
+        llm = provider.get_llm(config)
+        messages = [HumanMessage(content="Say 'hello' and nothing else.")]
+
+        chunks = []
+        async for chunk in llm.astream(messages):
+            if chunk.content:
+                chunks.append(chunk.content)
+
+        # Verify we got streaming chunks
+        assert len(chunks) > 0, "Expected at least one streaming chunk"
+        full_response = "".join(chunks)
+        assert "hello" in full_response.lower(), f"Expected 'hello' in response: {full_response}"
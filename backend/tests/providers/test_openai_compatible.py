@@ -8,16 +8,11 @@ This module tests the OpenAICompatibleProvider which handles:
 import os
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 from langchain_core.messages import HumanMessage
 
-from providers.openai_compatible import (
-    OpenAICompatibleProvider,
-    PROVIDER_CONFIGS,
-    ProviderConfig,
-)
-from providers.base import ModelConfig
+from providers.openai_compatible import OpenAICompatibleProvider, PROVIDER_CONFIGS
 
 
 # Environment variables for integration tests
@@ -25,22 +20,52 @@ OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 XAI_API_KEY = os.environ.get("XAI_API_KEY", "")
 OPENROUTER_API_KEY = os.environ.get("OPENROUTER_API_KEY", "")
 
+ALL_PROVIDER_TYPES = tuple(PROVIDER_CONFIGS)
+
+# (provider_type, api_key, api_base) for providers without LM Studio's
+# instance suffix, with config set up based on provider requirements
+NON_LM_STUDIO_CASES = [
+    (
+        provider_type,
+        "test-key" if PROVIDER_CONFIGS[provider_type].api_key_required else "",
+        "http://localhost:8000/v1" if provider_type in ("ollama", "vllm") else "",
+    )
+    for provider_type in ("openai", "grok", "openrouter", "ollama", "vllm")
+]
+
 
 # =============================================================================
 # Unit Tests - Parameterized across all provider types
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def openai_providers():
+    """One OpenAICompatibleProvider per provider type, shared by all tests."""
+    return {
+        provider_type: OpenAICompatibleProvider(provider_type)
+        for provider_type in ALL_PROVIDER_TYPES
+    }
+
+
+@pytest.fixture
+def mock_chat_openai(monkeypatch):
+    """Replace ChatOpenAI in the provider module with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr("providers.openai_compatible.ChatOpenAI", mock)
+    return mock
+
+
 class TestOpenAICompatibleProviderInstantiation:
     """Test provider instantiation for all types."""
 
-    @pytest.mark.parametrize("provider_type", list(PROVIDER_CONFIGS.keys()))
+    @pytest.mark.parametrize("provider_type", ALL_PROVIDER_TYPES)
     def test_provider_instantiation(self, provider_type):
         """All provider types should instantiate without errors."""
         provider = OpenAICompatibleProvider(provider_type)
         assert provider is not None
         assert provider.provider_type == provider_type
-        assert provider.provider_config == PROVIDER_CONFIGS[provider_type]
+        assert provider.provider_config is PROVIDER_CONFIGS[provider_type]
 
     def test_unknown_provider_raises_error(self):
         """Should raise KeyError for unknown provider type."""
@@ -59,16 +84,10 @@ class TestAPIKeyValidation:
             ("openrouter", "OPENROUTER_API_KEY"),
         ],
     )
-    def test_api_key_required(self, provider_type, env_var):
+    def test_api_key_required(self, provider_type, env_var, make_config, openai_providers):
         """Cloud providers should raise ValueError if no API key provided."""
-        provider = OpenAICompatibleProvider(provider_type)
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type=provider_type,
-            model_id="test-model-id",
-            api_base="",
-            api_key="",  # Empty API key
-        )
+        provider = openai_providers[provider_type]
+        config = make_config(provider_type, "test-model-id", api_key="")
 
         with pytest.raises(ValueError, match="API key is required"):
             provider.get_llm(config)
@@ -81,59 +100,41 @@ class TestAPIKeyValidation:
             ("openrouter", "OPENROUTER_API_KEY"),
         ],
     )
-    def test_api_key_error_mentions_env_var(self, provider_type, env_var):
+    def test_api_key_error_mentions_env_var(
+        self, provider_type, env_var, make_config, openai_providers
+    ):
         """Error message should mention the correct environment variable."""
-        provider = OpenAICompatibleProvider(provider_type)
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type=provider_type,
-            model_id="test-model-id",
-            api_base="",
-            api_key="",
-        )
+        provider = openai_providers[provider_type]
+        config = make_config(provider_type, "test-model-id", api_key="")
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=env_var):
             provider.get_llm(config)
 
-        assert env_var in str(exc_info.value)
-
     @pytest.mark.parametrize("provider_type", ["ollama", "vllm", "lm_studio"])
-    def test_local_providers_no_api_key_required(self, provider_type):
+    def test_local_providers_no_api_key_required(
+        self, mock_chat_openai, provider_type, make_config, openai_providers
+    ):
         """Local providers should work without API key."""
-        provider = OpenAICompatibleProvider(provider_type)
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type=provider_type,
-            model_id="test-model-id",
+        provider = openai_providers[provider_type]
+        config = make_config(
+            provider_type,
+            "test-model-id",
+            api_key="",
             api_base="http://localhost:8000/v1",
-            api_key="",  # Empty API key - should work for local providers
         )
 
         # Should not raise - just verify it works
-        with patch(
-            "providers.openai_compatible.ChatOpenAI"
-        ) as mock_chat:
-            mock_chat.return_value = MagicMock()
-            llm = provider.get_llm(config)
-            assert llm is not None
+        llm = provider.get_llm(config)
+        assert llm is not None
 
 
 class TestChatOpenAIConfiguration:
     """Test that ChatOpenAI is configured correctly for each provider."""
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_openai_configuration(self, mock_chat_openai):
+    def test_openai_configuration(self, mock_chat_openai, make_config, openai_providers):
         """OpenAI should be configured without base_url (uses default)."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("openai")
-        config = ModelConfig(
-            model_name="gpt-4o",
-            provider_type="openai",
-            model_id="gpt-4o",
-            api_base="",
-            api_key="sk-test-key",
-        )
+        provider = openai_providers["openai"]
+        config = make_config("openai", "gpt-4o", api_key="sk-test-key")
 
         provider.get_llm(config)
 
@@ -142,57 +143,32 @@ class TestChatOpenAIConfiguration:
         assert call_kwargs["api_key"] == "sk-test-key"
         assert "base_url" not in call_kwargs  # OpenAI uses default
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_grok_uses_xai_base_url(self, mock_chat_openai):
+    def test_grok_uses_xai_base_url(self, mock_chat_openai, make_config, openai_providers):
         """Grok should use xAI API base URL."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("grok")
-        config = ModelConfig(
-            model_name="grok-3",
-            provider_type="grok",
-            model_id="grok-3",
-            api_base="",  # Empty, should use default
-            api_key="xai-test-key",
-        )
+        provider = openai_providers["grok"]
+        config = make_config("grok", "grok-3", api_key="xai-test-key")
 
         provider.get_llm(config)
 
         call_kwargs = mock_chat_openai.call_args.kwargs
         assert call_kwargs["base_url"] == "https://api.x.ai/v1"
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_openrouter_uses_openrouter_base_url(self, mock_chat_openai):
+    def test_openrouter_uses_openrouter_base_url(
+        self, mock_chat_openai, make_config, openai_providers
+    ):
         """OpenRouter should use OpenRouter API base URL."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("openrouter")
-        config = ModelConfig(
-            model_name="or-claude",
-            provider_type="openrouter",
-            model_id="anthropic/claude-3-opus",
-            api_base="",
-            api_key="sk-or-test-key",
-        )
+        provider = openai_providers["openrouter"]
+        config = make_config("openrouter", "anthropic/claude-3-opus", api_key="sk-or-test-key")
 
         provider.get_llm(config)
 
         call_kwargs = mock_chat_openai.call_args.kwargs
         assert call_kwargs["base_url"] == "https://openrouter.ai/api/v1"
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_openrouter_sets_custom_headers(self, mock_chat_openai):
+    def test_openrouter_sets_custom_headers(self, mock_chat_openai, make_config, openai_providers):
         """OpenRouter should set HTTP-Referer and X-Title headers."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("openrouter")
-        config = ModelConfig(
-            model_name="or-claude",
-            provider_type="openrouter",
-            model_id="anthropic/claude-3-opus",
-            api_base="",
-            api_key="sk-or-test-key",
-        )
+        provider = openai_providers["openrouter"]
+        config = make_config("openrouter", "anthropic/claude-3-opus", api_key="sk-or-test-key")
 
         provider.get_llm(config)
 
@@ -203,20 +179,16 @@ class TestChatOpenAIConfiguration:
         assert headers.get("X-Title") == "Prizms"
 
     @pytest.mark.parametrize("provider_type", ["ollama", "vllm", "lm_studio"])
-    @patch("providers.openai_compatible.ChatOpenAI")
     def test_local_providers_use_not_needed_api_key(
-        self, mock_chat_openai, provider_type
+        self, mock_chat_openai, provider_type, make_config, openai_providers
     ):
         """Local providers should use 'not-needed' as API key placeholder."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider(provider_type)
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type=provider_type,
-            model_id="test-model-id",
-            api_base="http://localhost:8000/v1",
+        provider = openai_providers[provider_type]
+        config = make_config(
+            provider_type,
+            "test-model-id",
             api_key="",
+            api_base="http://localhost:8000/v1",
         )
 
         provider.get_llm(config)
@@ -224,18 +196,16 @@ class TestChatOpenAIConfiguration:
         call_kwargs = mock_chat_openai.call_args.kwargs
         assert call_kwargs["api_key"] == "not-needed"
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_custom_base_url_overrides_default(self, mock_chat_openai):
+    def test_custom_base_url_overrides_default(
+        self, mock_chat_openai, make_config, openai_providers
+    ):
         """Custom api_base in config should override provider default."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("grok")
-        config = ModelConfig(
-            model_name="grok-3",
-            provider_type="grok",
-            model_id="grok-3",
-            api_base="https://custom.api.com/v1",  # Custom URL
+        provider = openai_providers["grok"]
+        config = make_config(
+            "grok",
+            "grok-3",
             api_key="xai-test-key",
+            api_base="https://custom.api.com/v1",
         )
 
         provider.get_llm(config)
@@ -247,18 +217,16 @@ class TestChatOpenAIConfiguration:
 class TestLMStudioInstanceSuffix:
     """Test LM Studio's instance suffix handling for parallel execution."""
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_lm_studio_no_suffix_for_none_instance(self, mock_chat_openai):
+    def test_lm_studio_no_suffix_for_none_instance(
+        self, mock_chat_openai, make_config, openai_providers
+    ):
         """LM Studio should not add suffix for instance=None."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("lm_studio")
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type="lm_studio",
-            model_id="qwen/qwen3-4b",
-            api_base="http://localhost:1234/v1",
+        provider = openai_providers["lm_studio"]
+        config = make_config(
+            "lm_studio",
+            "qwen/qwen3-4b",
             api_key="",
+            api_base="http://localhost:1234/v1",
         )
 
         provider.get_llm(config, instance=None)
@@ -266,18 +234,16 @@ class TestLMStudioInstanceSuffix:
         call_kwargs = mock_chat_openai.call_args.kwargs
         assert call_kwargs["model"] == "qwen/qwen3-4b"
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_lm_studio_no_suffix_for_zero_instance(self, mock_chat_openai):
+    def test_lm_studio_no_suffix_for_zero_instance(
+        self, mock_chat_openai, make_config, openai_providers
+    ):
         """LM Studio should not add suffix for instance=0."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("lm_studio")
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type="lm_studio",
-            model_id="qwen/qwen3-4b",
-            api_base="http://localhost:1234/v1",
+        provider = openai_providers["lm_studio"]
+        config = make_config(
+            "lm_studio",
+            "qwen/qwen3-4b",
             api_key="",
+            api_base="http://localhost:1234/v1",
         )
 
         provider.get_llm(config, instance=0)
@@ -285,18 +251,16 @@ class TestLMStudioInstanceSuffix:
         call_kwargs = mock_chat_openai.call_args.kwargs
         assert call_kwargs["model"] == "qwen/qwen3-4b"
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_lm_studio_adds_suffix_for_nonzero_instance(self, mock_chat_openai):
+    def test_lm_studio_adds_suffix_for_nonzero_instance(
+        self, mock_chat_openai, make_config, openai_providers
+    ):
         """LM Studio should add :N suffix for instance > 0."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider("lm_studio")
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type="lm_studio",
-            model_id="qwen/qwen3-4b",
-            api_base="http://localhost:1234/v1",
+        provider = openai_providers["lm_studio"]
+        config = make_config(
+            "lm_studio",
+            "qwen/qwen3-4b",
             api_key="",
+            api_base="http://localhost:1234/v1",
         )
 
         provider.get_llm(config, instance=1)
@@ -304,45 +268,26 @@ class TestLMStudioInstanceSuffix:
         call_kwargs = mock_chat_openai.call_args.kwargs
         assert call_kwargs["model"] == "qwen/qwen3-4b:2"  # instance + 1
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_lm_studio_suffix_increments_correctly(self, mock_chat_openai):
+    @pytest.mark.parametrize("instance", [1, 2, 5, 10])
+    def test_lm_studio_suffix_increments_correctly(
+        self, mock_chat_openai, instance, make_config, openai_providers
+    ):
         """LM Studio instance suffix should be instance + 1."""
-        mock_chat_openai.return_value = MagicMock()
+        provider = openai_providers["lm_studio"]
+        config = make_config("lm_studio", "model", api_key="", api_base="http://localhost:1234/v1")
 
-        provider = OpenAICompatibleProvider("lm_studio")
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type="lm_studio",
-            model_id="model",
-            api_base="http://localhost:1234/v1",
-            api_key="",
-        )
+        provider.get_llm(config, instance=instance)
 
-        for instance in [1, 2, 5, 10]:
-            provider.get_llm(config, instance=instance)
-            call_kwargs = mock_chat_openai.call_args.kwargs
-            expected = f"model:{instance + 1}"
-            assert call_kwargs["model"] == expected
+        call_kwargs = mock_chat_openai.call_args.kwargs
+        assert call_kwargs["model"] == f"model:{instance + 1}"
 
-    @pytest.mark.parametrize("provider_type", ["openai", "grok", "openrouter", "ollama", "vllm"])
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_other_providers_ignore_instance(self, mock_chat_openai, provider_type):
+    @pytest.mark.parametrize("provider_type,api_key,api_base", NON_LM_STUDIO_CASES)
+    def test_other_providers_ignore_instance(
+        self, mock_chat_openai, provider_type, api_key, api_base, make_config, openai_providers
+    ):
         """Non-LM Studio providers should ignore instance parameter."""
-        mock_chat_openai.return_value = MagicMock()
-
-        provider = OpenAICompatibleProvider(provider_type)
-        
-        # Set up config based on provider requirements
-        api_key = "test-key" if PROVIDER_CONFIGS[provider_type].api_key_required else ""
-        api_base = "http://localhost:8000/v1" if provider_type in ["ollama", "vllm"] else ""
-        
-        config = ModelConfig(
-            model_name="test-model",
-            provider_type=provider_type,
-            model_id="test-model-id",
-            api_base=api_base,
-            api_key=api_key,
-        )
+        provider = openai_providers[provider_type]
+        config = make_config(provider_type, "test-model-id", api_key=api_key, api_base=api_base)
 
         provider.get_llm(config, instance=5)
 
@@ -354,67 +299,48 @@ class TestLMStudioInstanceSuffix:
 class TestFactoryRegistration:
     """Test that all providers are correctly registered in the factory."""
 
-    def test_all_providers_in_factory(self):
+    def test_all_providers_in_factory(self, providers_registry):
         """All OpenAI-compatible providers should be available via get_providers."""
-        from providers.factory import get_providers
-
-        providers = get_providers()
-
-        for provider_type in PROVIDER_CONFIGS.keys():
-            assert provider_type in providers
-            assert isinstance(providers[provider_type], OpenAICompatibleProvider)
-            assert providers[provider_type].provider_type == provider_type
+        for provider_type in ALL_PROVIDER_TYPES:
+            assert provider_type in providers_registry
+            assert isinstance(providers_registry[provider_type], OpenAICompatibleProvider)
+            assert providers_registry[provider_type].provider_type == provider_type
 
 
 class TestDifferentModels:
     """Test that different model IDs are passed correctly."""
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_openai_models(self, mock_chat_openai):
+    @pytest.mark.parametrize(
+        "model_id", ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
+    )
+    def test_openai_models(self, mock_chat_openai, model_id, make_config, openai_providers):
         """OpenAI should pass various model IDs correctly."""
-        mock_chat_openai.return_value = MagicMock()
-        provider = OpenAICompatibleProvider("openai")
-
-        models = ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
-
-        for model_id in models:
-            config = ModelConfig(
-                model_name="test",
-                provider_type="openai",
-                model_id=model_id,
-                api_base="",
-                api_key="sk-test-key",
-            )
-            provider.get_llm(config)
+        provider = openai_providers["openai"]
+        config = make_config("openai", model_id, api_key="sk-test-key")
 
-            call_kwargs = mock_chat_openai.call_args.kwargs
-            assert call_kwargs["model"] == model_id
+        provider.get_llm(config)
 
-    @patch("providers.openai_compatible.ChatOpenAI")
-    def test_openrouter_models(self, mock_chat_openai):
-        """OpenRouter should pass provider/model format correctly."""
-        mock_chat_openai.return_value = MagicMock()
-        provider = OpenAICompatibleProvider("openrouter")
+        call_kwargs = mock_chat_openai.call_args.kwargs
+        assert call_kwargs["model"] == model_id
 
-        models = [
+    @pytest.mark.parametrize(
+        "model_id",
+        [
             "anthropic/claude-3-opus",
             "openai/gpt-4-turbo",
             "meta-llama/llama-3.1-70b-instruct",
             "mistralai/mistral-large",
-        ]
-
-        for model_id in models:
-            config = ModelConfig(
-                model_name="test",
-                provider_type="openrouter",
-                model_id=model_id,
-                api_base="",
-                api_key="sk-or-test-key",
-            )
-            provider.get_llm(config)
+        ],
+    )
+    def test_openrouter_models(self, mock_chat_openai, model_id, make_config, openai_providers):
+        """OpenRouter should pass provider/model format correctly."""
+        provider = openai_providers["openrouter"]
+        config = make_config("openrouter", model_id, api_key="sk-or-test-key")
+
+        provider.get_llm(config)
 
-            call_kwargs = mock_chat_openai.call_args.kwargs
-            assert call_kwargs["model"] == model_id
+        call_kwargs = mock_chat_openai.call_args.kwargs
+        assert call_kwargs["model"] == model_id
 
 
 # =============================================================================
@@ -422,103 +348,54 @@ class TestDifferentModels:
 # =============================================================================
 
 
-@pytest.mark.skipif(
-    not OPENAI_API_KEY, reason="OPENAI_API_KEY environment variable not set"
-)
-class TestOpenAIIntegration:
-    """Integration tests requiring a real OpenAI API key.
-
-    These tests are skipped by default. To run them:
-        OPENAI_API_KEY=sk-... uv run pytest tests/providers/test_openai_compatible.py -v -k "OpenAIIntegration"
-    """
-
-    @pytest.mark.asyncio
-    async def test_streaming_response(self):
-        """Verify streaming chunks arrive from the OpenAI API."""
-        provider = OpenAICompatibleProvider("openai")
-        config = ModelConfig(
-            model_name="gpt-4o-mini",
-            provider_type="openai",
-            model_id="gpt-4o-mini",  # Fastest/cheapest model
-            api_base="",
-            api_key=OPENAI_API_KEY,
-        )
-
-        llm = provider.get_llm(config)
-        messages = [HumanMessage(content="Say 'hello' and nothing else.")]
-
-        chunks = []
-        async for chunk in llm.astream(messages):
-            if chunk.content:
-                chunks.append(chunk.content)
-
-        # Verify we got streaming chunks
-        assert len(chunks) > 0, "Expected at least one streaming chunk"
-        full_response = "".join(chunks)
-        assert (
-            "hello" in full_response.lower()
-        ), f"Expected 'hello' in response: {full_response}"
-
-
-@pytest.mark.skipif(
-    not XAI_API_KEY, reason="XAI_API_KEY environment variable not set"
-)
-class TestGrokIntegration:
-    """Integration tests requiring a real xAI API key.
-
-    These tests are skipped by default. To run them:
-        XAI_API_KEY=xai-... uv run pytest tests/providers/test_openai_compatible.py -v -k "GrokIntegration"
-    """
-
-    @pytest.mark.asyncio
-    async def test_streaming_response(self):
-        """Verify streaming chunks arrive from the xAI API."""
-        provider = OpenAICompatibleProvider("grok")
-        config = ModelConfig(
-            model_name="grok-3",
-            provider_type="grok",
-            model_id="grok-3",  # Current recommended model
-            api_base="",
-            api_key=XAI_API_KEY,
-        )
-
-        llm = provider.get_llm(config)
-        messages = [HumanMessage(content="Say 'hello' and nothing else.")]
-
-        chunks = []
-        async for chunk in llm.astream(messages):
-            if chunk.content:
-                chunks.append(chunk.content)
-
-        # Verify we got streaming chunks
-        assert len(chunks) > 0, "Expected at least one streaming chunk"
-        full_response = "".join(chunks)
-        assert (
-            "hello" in full_response.lower()
-        ), f"Expected 'hello' in response: {full_response}"
-
-
-@pytest.mark.skipif(
-    not OPENROUTER_API_KEY, reason="OPENROUTER_API_KEY environment variable not set"
-)
-class TestOpenRouterIntegration:
-    """Integration tests requiring a real OpenRouter API key.
-
-    These tests are skipped by default. To run them:
-        OPENROUTER_API_KEY=sk-or-... uv run pytest tests/providers/test_openai_compatible.py -v -k "OpenRouterIntegration"
+# (provider_type, model ID, API key)
+INTEGRATION_CASES = [
+    pytest.param(
+        "openai",
+        "gpt-4o-mini",  # Fastest/cheapest model
+        OPENAI_API_KEY,
+        id="openai",
+        marks=pytest.mark.skipif(
+            not OPENAI_API_KEY, reason="OPENAI_API_KEY environment variable not set"
+        ),
+    ),
+    pytest.param(
+        "grok",
+        "grok-3",  # Current recommended model
+        XAI_API_KEY,
+        id="grok",
+        marks=pytest.mark.skipif(
+            not XAI_API_KEY, reason="XAI_API_KEY environment variable not set"
+        ),
+    ),
+    pytest.param(
+        "openrouter",
+        "anthropic/claude-3.5-sonnet",  # Fast and economical via OpenRouter
+        OPENROUTER_API_KEY,
+        id="openrouter",
+        marks=pytest.mark.skipif(
+            not OPENROUTER_API_KEY,
+            reason="OPENROUTER_API_KEY environment variable not set",
+        ),
+    ),
+]
+
+
+@pytest.mark.integration
+class TestOpenAICompatibleIntegration:
+    """Integration tests requiring real API keys.
+
+    Each case is skipped unless its API key is set. To run them:
+        OPENAI_API_KEY=sk-... XAI_API_KEY=xai-... OPENROUTER_API_KEY=sk-or-... uv run pytest tests/providers/test_openai_compatible.py --run-integration -v -k "Integration"
     """
 
-    @pytest.mark.asyncio
-    async def test_streaming_response(self):
-        """Verify streaming chunks arrive from the OpenRouter API."""
-        provider = OpenAICompatibleProvider("openrouter")
-        config = ModelConfig(
-            model_name="or-claude-sonnet",
-            provider_type="openrouter",
-            model_id="anthropic/claude-3.5-sonnet",  # Fast and economical via OpenRouter
-            api_base="",
-            api_key=OPENROUTER_API_KEY,
-        )
+    @pytest.mark.parametrize("provider_type,model_id,api_key", INTEGRATION_CASES)
+    async def test_streaming_response(
+        self, provider_type, model_id, api_key, make_config, openai_providers
+    ):
+        """Verify streaming chunks arrive from the provider's API."""
+        provider = openai_providers[provider_type]
+        config = make_config(provider_type, model_id, api_key=api_key)
 
         llm = provider.get_llm(config)
         messages = [HumanMessage(content="Say 'hello' and nothing else.")]